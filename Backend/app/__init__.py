@@ -21,6 +21,18 @@ def create_app():
     # Configure app
     app.config['GITHUB_TOKEN'] = os.getenv('GITHUB_TOKEN')
     app.config['HUGGINGFACE_TOKEN'] = os.getenv('HUGGINGFACE_TOKEN')
+    # Repositories larger than this (in KB, as reported by GitHub) skip the clone in 'auto' mode
+    app.config['FAST_ANALYSIS_SIZE_THRESHOLD_KB'] = int(os.getenv('FAST_ANALYSIS_SIZE_THRESHOLD_KB', '50000'))
+    
+    app.config['BLOB_STORE_PATH'] = os.getenv('BLOB_STORE_PATH', os.path.join(app.instance_path, 'blob_store.sqlite3'))
+    app.config['BLOB_STORE_MAX_BYTES'] = int(os.getenv('BLOB_STORE_MAX_BYTES', str(256 * 1024 * 1024)))
+    
+    # Shared per-file analysis results across all analyzed repositories
+    from .services.blob_store import BlobStore
+    app.extensions['blob_store'] = BlobStore(
+        app.config['BLOB_STORE_PATH'],
+        max_bytes=app.config['BLOB_STORE_MAX_BYTES']
+    )
     
     # Enable debug mode
     app.debug = True
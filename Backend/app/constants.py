@@ -0,0 +1,5 @@
+# File extensions treated as source code by both the deep and fast analysis paths
+CODE_EXTENSIONS = ('.py', '.js', '.java', '.cpp', '.go', '.rb')
+
+# File names treated as application entry points
+ENTRY_POINT_FILES = ('main.py', 'app.py', 'index.js', 'main.go')
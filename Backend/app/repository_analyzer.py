@@ -13,11 +13,17 @@ import ast
 import networkx as nx
 from collections import defaultdict
 import json
+from .constants import CODE_EXTENSIONS, ENTRY_POINT_FILES
+from .services.blob_store import BlobStore, git_blob_sha
+
+# Git index modes for regular and executable files
+REGULAR_FILE_MODES = (0o100644, 0o100755)
 
 class RepositoryAnalyzer:
-    def __init__(self, github_token: str, huggingface_token: str):
+    def __init__(self, github_token: str, huggingface_token: str, blob_store: BlobStore = None):
         self.github = Github(github_token)
         self.huggingface_token = huggingface_token
+        self.blob_store = blob_store
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         
         # Initialize models
@@ -34,10 +40,11 @@ class RepositoryAnalyzer:
         Repo.clone_from(repo_url, temp_dir)
         return temp_dir, repo_name
 
-    def analyze_code_complexity(self, code: str) -> Dict:
-        """Analyze code complexity metrics."""
+    def analyze_code_complexity(self, code: str, tree: ast.AST = None) -> Dict:
+        """Analyze code complexity metrics, reusing an already parsed tree if given."""
         try:
-            tree = ast.parse(code)
+            if tree is None:
+                tree = ast.parse(code)
             complexity = {
                 'cyclomatic_complexity': 0,
                 'function_count': 0,
@@ -79,6 +86,44 @@ class RepositoryAnalyzer:
         except:
             return {}
 
+    def extract_imports(self, code: str, tree: ast.AST = None) -> List[str]:
+        """Extract the modules imported by Python code, reusing an already parsed tree if given."""
+        if tree is None:
+            try:
+                tree = ast.parse(code)
+            except:
+                return []
+            
+        imports = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imports.add(node.module)
+                
+        return sorted(imports)
+
+    def analyze_file(self, code: str) -> Tuple[Dict, List[str]]:
+        """Parse code once and return its complexity metrics and imports."""
+        try:
+            tree = ast.parse(code)
+        except:
+            return {}, []
+        return self.analyze_code_complexity(code, tree), self.extract_imports(code, tree)
+
+    def get_blob_shas(self, repo_path: str) -> Dict[str, str]:
+        """Map absolute file paths to git blob SHAs from the clone's index, without reading files."""
+        try:
+            index = Repo(repo_path).index
+            # Symlink blobs hash the link target path, not the content open() reads, so skip them
+            return {
+                os.path.join(repo_path, path): entry.hexsha
+                for (path, _), entry in index.entries.items()
+                if entry.mode in REGULAR_FILE_MODES
+            }
+        except:
+            return {}
+
     def analyze_dependencies(self, repo_path: str) -> Dict:
         """Analyze project dependencies."""
         dependencies = {
@@ -114,35 +159,68 @@ class RepositoryAnalyzer:
             'dependencies': set(),
             'entry_points': [],
             'complexity_metrics': defaultdict(dict),
+            'imports': {},
             'dependencies': self.analyze_dependencies(repo_path)
         }
         
+        # Resolve every analyzed blob against the store in bulk before reading any file
+        blob_shas = {}
+        if self.blob_store:
+            blob_shas = {
+                path: sha for path, sha in self.get_blob_shas(repo_path).items()
+                if path.endswith(CODE_EXTENSIONS)
+            }
+        cached = self.blob_store.get_many(set(blob_shas.values()), required=('metrics', 'imports')) if blob_shas else {}
+        new_entries = {}
+        
         for root, _, files in os.walk(repo_path):
             for file in files:
-                if file.endswith(('.py', '.js', '.java', '.cpp', '.go', '.rb')):
+                if file.endswith(CODE_EXTENSIONS):
                     ext = os.path.splitext(file)[1]
                     structure['languages'][ext] = structure['languages'].get(ext, 0) + 1
                     
                     file_path = os.path.join(root, file)
-                    if file in ['main.py', 'app.py', 'index.js', 'main.go']:
+                    if file in ENTRY_POINT_FILES:
                         structure['entry_points'].append(file_path)
                     
-                    # Analyze code complexity
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            code = f.read()
-                            structure['complexity_metrics'][file_path] = self.analyze_code_complexity(code)
-                    except:
-                        pass
+                    sha = blob_shas.get(file_path)
+                    # Identical copies within this tree reuse the first copy's results
+                    entry = cached.get(sha) or new_entries.get(sha)
+                    if entry:
+                        structure['complexity_metrics'][file_path] = entry['metrics']
+                        structure['imports'][file_path] = entry['imports']
+                    else:
+                        # Analyze code complexity
+                        try:
+                            with open(file_path, 'r', encoding='utf-8') as f:
+                                code = f.read()
+                            metrics, imports = self.analyze_file(code)
+                        except:
+                            # Unreadable files get the same empty result as files that don't parse
+                            metrics, imports = {}, []
+                            
+                        structure['complexity_metrics'][file_path] = metrics
+                        structure['imports'][file_path] = imports
+                        if sha:
+                            new_entries[sha] = {'metrics': metrics, 'imports': imports}
                     
                     # Check for dependency files
                     if file in ['requirements.txt', 'package.json', 'go.mod', 'Gemfile']:
                         structure['dependencies'].add(os.path.join(root, file))
         
+        if self.blob_store:
+            self.blob_store.put_many(new_entries)
+        
         return structure
 
     def generate_code_summary(self, code: str) -> str:
         """Generate a summary of the code using CodeT5 model."""
+        sha = git_blob_sha(code.encode('utf-8')) if self.blob_store else None
+        if sha:
+            entry = self.blob_store.get(sha, required=('summary',))
+            if entry:
+                return entry['summary']
+                
         inputs = self.code_tokenizer.encode(
             "summarize: " + code,
             return_tensors="pt",
@@ -157,7 +235,11 @@ class RepositoryAnalyzer:
             early_stopping=True
         )
         
-        return self.code_tokenizer.decode(outputs[0], skip_special_tokens=True)
+        summary = self.code_tokenizer.decode(outputs[0], skip_special_tokens=True)
+        if sha:
+            self.blob_store.put(sha, summary=summary)
+            
+        return summary
 
     def analyze_repository(self, repo_url: str) -> Dict:
         """Main method to analyze a repository and generate documentation."""
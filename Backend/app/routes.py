@@ -1,5 +1,10 @@
 from flask import Blueprint, request, jsonify, current_app
 from .repository_analyzer import RepositoryAnalyzer
+from .services.github_service import GitHubService
+from .services.analysis_service import AnalysisService
+from .services.documentation_service import DocumentationService
+
+ANALYSIS_MODES = ('auto', 'fast', 'deep')
 
 main = Blueprint('main', __name__)
 
@@ -12,8 +17,14 @@ def index():
                 'method': 'POST',
                 'description': 'Analyze a GitHub repository',
                 'body': {
-                    'repo_url': 'GitHub repository URL'
+                    'repo_url': 'GitHub repository URL',
+                    'mode': "Optional: 'auto' (default), 'fast' (metadata only, no clone) or 'deep' (full clone)",
+                    'include_summary': 'Optional: generate the CodeT5 summary in fast mode (default false)'
                 }
+            },
+            '/api/cache/stats': {
+                'method': 'GET',
+                'description': 'Hit-rate and size statistics for the per-file analysis store'
             }
         }
     })
@@ -24,23 +35,75 @@ def analyze_repository():
         data = request.get_json()
         repo_url = data.get('repo_url')
         
+        mode = data.get('mode', 'auto')
+        include_summary = data.get('include_summary', False)
+        
         if not repo_url:
             return jsonify({'error': 'Repository URL is required'}), 400
+        if mode not in ANALYSIS_MODES:
+            return jsonify({'error': f"Invalid mode, expected one of: {', '.join(ANALYSIS_MODES)}"}), 400
+        if not isinstance(include_summary, bool):
+            return jsonify({'error': 'include_summary must be a boolean'}), 400
             
-        # Initialize analyzer with tokens from config
-        analyzer = RepositoryAnalyzer(
-            github_token=current_app.config['GITHUB_TOKEN'],
-            huggingface_token=current_app.config['HUGGINGFACE_TOKEN']
-        )
-        
-        # Analyze repository
-        result = analyzer.analyze_repository(repo_url)
-        
+        github_service = GitHubService()
+        repo = None
+        if mode == 'fast':
+            repo = github_service.get_repository(repo_url)
+        elif mode == 'auto':
+            # Pick fast or deep analysis from the repository size before any clone starts.
+            # Non-GitHub URLs, rate limits and repos the token can't read still get a clone.
+            try:
+                repo = github_service.get_repository(repo_url)
+                mode = _select_analysis_mode(repo)
+            except Exception as e:
+                current_app.logger.warning(f'Repository metadata lookup failed, using deep analysis: {e}')
+                mode = 'deep'
+            
+        if mode == 'fast':
+            result = _fast_analysis(github_service, repo, include_summary)
+        else:
+            # Initialize analyzer with tokens from config
+            analyzer = RepositoryAnalyzer(
+                github_token=current_app.config['GITHUB_TOKEN'],
+                huggingface_token=current_app.config['HUGGINGFACE_TOKEN'],
+                blob_store=current_app.extensions['blob_store']
+            )
+            
+            # Analyze repository
+            result = analyzer.analyze_repository(repo_url)
+            
+        result['mode'] = mode
         return jsonify(result)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _select_analysis_mode(repo) -> str:
+    """Choose 'fast' for repositories above the configured size threshold, 'deep' otherwise."""
+    # GitHub reports repository size in KB
+    if repo.size > current_app.config['FAST_ANALYSIS_SIZE_THRESHOLD_KB']:
+        return 'fast'
+    return 'deep'
+
+def _fast_analysis(github_service: GitHubService, repo, include_summary: bool) -> dict:
+    """Build documentation from the GitHub API file listing and metadata, without cloning."""
+    repo_data = github_service.fetch_repository(repo)
+    analysis_service = AnalysisService()
+    analysis = analysis_service.analyze_repository(repo_data, include_summary=include_summary)
+    documentation = DocumentationService().generate_documentation(repo_data, analysis)
+    
+    return {
+        'repository_name': repo_data['name'],
+        'structure': analysis_service.summarize_structure(repo_data),
+        'readme_content': documentation['readme'],
+        'documentation': documentation,
+        'truncated': repo_data['truncated']
+    }
+
+@main.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    return jsonify(current_app.extensions['blob_store'].stats())
+
 @main.route('/api/health', methods=['GET'])
 def health_check():
     current_app.logger.info('Health check request received')
@@ -3,17 +3,30 @@ from flask import current_app
 import torch
 from typing import Dict, Any, List
 import re
+from ..constants import CODE_EXTENSIONS, ENTRY_POINT_FILES
 
 class AnalysisService:
     def __init__(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.tokenizer = AutoTokenizer.from_pretrained("Salesforce/codet5-base")
-        self.model = AutoModelForSeq2SeqLM.from_pretrained("Salesforce/codet5-base").to(self.device)
+        # CodeT5 is loaded on first use so metadata-only analysis never pays for it
+        self.tokenizer = None
+        self.model = None
         
-    def analyze_repository(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _load_model(self):
+        """Load the CodeT5 tokenizer and model if not already loaded."""
+        if self.model is None:
+            self.tokenizer = AutoTokenizer.from_pretrained("Salesforce/codet5-base")
+            self.model = AutoModelForSeq2SeqLM.from_pretrained("Salesforce/codet5-base").to(self.device)
+        
+    def analyze_repository(self, repo_data: Dict[str, Any], include_summary: bool = True) -> Dict[str, Any]:
         """Analyze repository code and structure."""
+        if include_summary:
+            project_summary = self._generate_project_summary(repo_data)
+        else:
+            project_summary = repo_data['description'] or 'No description provided.'
+            
         analysis = {
-            'project_summary': self._generate_project_summary(repo_data),
+            'project_summary': project_summary,
             'tech_stack': self._detect_tech_stack(repo_data),
             'code_analysis': self._analyze_code_structure(repo_data),
             'complexity_metrics': self._calculate_complexity_metrics(repo_data)
@@ -31,6 +44,7 @@ class AnalysisService:
         """
         
         # Generate summary using CodeT5
+        self._load_model()
         inputs = self.tokenizer.encode(
             f"summarize: {context}",
             return_tensors="pt",
@@ -82,7 +96,8 @@ class AnalysisService:
             'total_files': len(repo_data['files']),
             'file_types': {},
             'main_directories': set(),
-            'architecture_patterns': []
+            'architecture_patterns': [],
+            'truncated': repo_data.get('truncated', False)
         }
         
         # Analyze file types and directories
@@ -114,4 +129,30 @@ class AnalysisService:
             ext = file['path'].split('.')[-1] if '.' in file['path'] else 'no_extension'
             metrics['file_types'][ext] = metrics['file_types'].get(ext, 0) + 1
             
-        return metrics 
\ No newline at end of file
+        return metrics
+        
+    def summarize_structure(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a RepositoryAnalyzer-shaped structure from the file listing alone."""
+        structure = {
+            'languages': {},
+            'main_files': [],
+            'entry_points': [],
+            'complexity_metrics': {},
+            'dependencies': {
+                'python': [],
+                'javascript': [],
+                'java': [],
+                'ruby': []
+            }
+        }
+        
+        for file in repo_data['files']:
+            name = file['path'].split('/')[-1]
+            if name.endswith(CODE_EXTENSIONS):
+                ext = '.' + name.split('.')[-1]
+                structure['languages'][ext] = structure['languages'].get(ext, 0) + 1
+                
+                if name in ENTRY_POINT_FILES:
+                    structure['entry_points'].append(file['path'])
+                    
+        return structure
@@ -0,0 +1,186 @@
+import sqlite3
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Iterable, Optional
+
+# SQLite's default limit on host parameters per statement is 999
+_BATCH_SIZE = 900
+_FIELDS = ('metrics', 'imports', 'summary')
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA-1 of raw file content, as `git hash-object` would."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class BlobStore:
+    """Cross-repository store of per-file analysis results keyed by git blob SHA.
+
+    Each entry may hold complexity metrics, a parsed import list and a code summary.
+    The database is bounded to max_bytes of stored payload; least recently used
+    entries are evicted first.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha TEXT PRIMARY KEY,
+                metrics TEXT,
+                imports TEXT,
+                summary TEXT,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_blobs_last_access ON blobs (last_access)")
+
+        # Running payload total kept in step by triggers, so writes never scan the table
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) "
+            "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM blobs"
+        )
+        self._conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS blobs_insert AFTER INSERT ON blobs BEGIN
+                UPDATE meta SET value = value + NEW.size WHERE key = 'total_bytes';
+            END;
+            CREATE TRIGGER IF NOT EXISTS blobs_update AFTER UPDATE OF size ON blobs BEGIN
+                UPDATE meta SET value = value - OLD.size + NEW.size WHERE key = 'total_bytes';
+            END;
+            CREATE TRIGGER IF NOT EXISTS blobs_delete AFTER DELETE ON blobs BEGIN
+                UPDATE meta SET value = value - OLD.size WHERE key = 'total_bytes';
+            END;
+        """)
+        self._conn.commit()
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT value FROM meta WHERE key = 'total_bytes'").fetchone()[0]
+
+    def get_many(self, shas: Iterable[str], required: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+        """Look up many blobs at once and return the stored fields for each hit.
+
+        A blob only counts as a hit when every field in `required` is stored for it.
+        """
+        shas = list(dict.fromkeys(shas))
+        required = list(required)
+        if any(field not in _FIELDS for field in required):
+            raise ValueError(f"Unknown blob fields: {required}")
+        conditions = ''.join(f" AND {field} IS NOT NULL" for field in required)
+        results = {}
+
+        with self._lock:
+            now = time.time()
+            touched = False
+            for i in range(0, len(shas), _BATCH_SIZE):
+                batch = shas[i:i + _BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT sha, metrics, imports, summary FROM blobs WHERE sha IN ({placeholders}){conditions}",
+                    batch
+                ).fetchall()
+                for sha, metrics, imports, summary in rows:
+                    results[sha] = {
+                        'metrics': json.loads(metrics) if metrics is not None else None,
+                        'imports': json.loads(imports) if imports is not None else None,
+                        'summary': summary
+                    }
+                if rows:
+                    hit_shas = [row[0] for row in rows]
+                    self._conn.execute(
+                        f"UPDATE blobs SET last_access = ? WHERE sha IN ({','.join('?' * len(hit_shas))})",
+                        [now] + hit_shas
+                    )
+                    touched = True
+            if touched:
+                self._conn.commit()
+
+            self.hits += len(results)
+            self.misses += len(shas) - len(results)
+
+        return results
+
+    def get(self, sha: str, required: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+        """Look up a single blob."""
+        return self.get_many([sha], required).get(sha)
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]):
+        """Store results for many blobs; fields left out or None keep their stored value."""
+        if not entries:
+            return
+
+        now = time.time()
+        rows = []
+        for sha, entry in entries.items():
+            metrics = json.dumps(entry['metrics']) if entry.get('metrics') is not None else None
+            imports = json.dumps(entry['imports']) if entry.get('imports') is not None else None
+            summary = entry.get('summary')
+            size = sum(len(value) for value in (metrics, imports, summary) if value is not None)
+            rows.append((sha, metrics, imports, summary, size, now))
+
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO blobs (sha, metrics, imports, summary, size, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(sha) DO UPDATE SET
+                    metrics = COALESCE(excluded.metrics, metrics),
+                    imports = COALESCE(excluded.imports, imports),
+                    summary = COALESCE(excluded.summary, summary),
+                    size = LENGTH(COALESCE(excluded.metrics, metrics, ''))
+                         + LENGTH(COALESCE(excluded.imports, imports, ''))
+                         + LENGTH(COALESCE(excluded.summary, summary, '')),
+                    last_access = excluded.last_access
+            """, rows)
+            self._evict()
+            self._conn.commit()
+
+    def put(self, sha: str, **fields):
+        """Store results for a single blob."""
+        self.put_many({sha: {key: fields.get(key) for key in _FIELDS}})
+
+    def _evict(self):
+        """Drop least recently used entries until the store fits in max_bytes."""
+        excess = self._total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for sha, size in self._conn.execute("SELECT sha, size FROM blobs ORDER BY last_access"):
+            victims.append(sha)
+            excess -= size
+            if excess <= 0:
+                break
+
+        for i in range(0, len(victims), _BATCH_SIZE):
+            batch = victims[i:i + _BATCH_SIZE]
+            self._conn.execute(f"DELETE FROM blobs WHERE sha IN ({','.join('?' * len(batch))})", batch)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit-rate and size statistics for the store."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            total_bytes = self._total_bytes()
+            lookups = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': entries,
+                'total_bytes': total_bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -75,6 +75,9 @@ This project is licensed under the MIT License - see the LICENSE file for detail
         structure = analysis_results['code_analysis']
         output = f"Total Files: {structure['total_files']}\n\n"
         
+        if structure.get('truncated'):
+            output += "> Note: GitHub truncated the file listing for this repository, so the structure below is incomplete.\n\n"
+        
         # Add main directories
         output += "Main Directories:\n"
         for directory in sorted(structure['main_directories']):
@@ -1,7 +1,7 @@
-from github import Github
+from github import Github, GithubException
 from flask import current_app
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import base64
 
 class GitHubService:
@@ -14,12 +14,19 @@ class GitHubService:
         match = re.search(pattern, url)
         if not match:
             raise ValueError("Invalid GitHub repository URL")
-        return match.group(1), match.group(2)
+        return match.group(1), re.sub(r'\.git$', '', match.group(2))
         
-    def fetch_repository(self, repo_url: str) -> Dict[str, Any]:
-        """Fetch repository data from GitHub."""
+    def get_repository(self, repo_url: str):
+        """Get the GitHub repository object for a URL, without cloning."""
         owner, repo_name = self._extract_repo_info(repo_url)
-        repo = self.github.get_repo(f"{owner}/{repo_name}")
+        return self.github.get_repo(f"{owner}/{repo_name}")
+        
+    def fetch_repository(self, repo) -> Dict[str, Any]:
+        """Fetch repository data from GitHub, given a URL or an already fetched repository object."""
+        if isinstance(repo, str):
+            repo = self.get_repository(repo)
+            
+        files, truncated = self._get_repository_files(repo)
         
         # Get repository details
         repo_data = {
@@ -32,29 +39,39 @@ class GitHubService:
             'topics': repo.get_topics(),
             'created_at': repo.created_at.isoformat(),
             'updated_at': repo.updated_at.isoformat(),
-            'files': self._get_repository_files(repo),
+            'files': files,
+            'truncated': truncated,
             'readme': self._get_readme_content(repo)
         }
         
         return repo_data
         
-    def _get_repository_files(self, repo) -> List[Dict[str, Any]]:
-        """Get all files in the repository."""
-        files = []
-        contents = repo.get_contents("")
+    def _get_repository_files(self, repo) -> Tuple[List[Dict[str, Any]], bool]:
+        """Get all files in the repository and whether GitHub truncated the listing."""
+        # A single recursive tree request instead of one contents request per directory
+        try:
+            tree = repo.get_git_tree(repo.default_branch, recursive=True)
+        except GithubException as e:
+            # GitHub answers 409 Conflict for an empty repository
+            if e.status == 409:
+                return [], False
+            raise
+        
+        # GitHub cuts off recursive trees past its entry and size limits
+        truncated = bool(tree.raw_data.get('truncated', False))
+        
+        files = [
+            {
+                'path': element.path,
+                'size': element.size or 0,
+                'type': 'file',
+                'sha': element.sha
+            }
+            for element in tree.tree
+            if element.type == "blob"
+        ]
         
-        while contents:
-            file_content = contents.pop(0)
-            if file_content.type == "dir":
-                contents.extend(repo.get_contents(file_content.path))
-            else:
-                files.append({
-                    'path': file_content.path,
-                    'size': file_content.size,
-                    'type': file_content.type
-                })
-                
-        return files
+        return files, truncated
         
     def _get_readme_content(self, repo) -> str:
         """Get README content if it exists."""
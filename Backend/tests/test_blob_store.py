@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from app.services import blob_store as blob_store_module
+from app.services.blob_store import BlobStore, git_blob_sha
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / 'blobs.sqlite3'))
+
+
+def _payload_size(**fields):
+    return sum(
+        len(value if name == 'summary' else json.dumps(value))
+        for name, value in fields.items()
+    )
+
+
+def _stored_sizes(store):
+    return dict(store._conn.execute("SELECT sha, size FROM blobs"))
+
+
+def test_git_blob_sha_matches_git_hash_object():
+    assert git_blob_sha(b'hello\n') == 'ce013625030ba8dba906f756967f9e9ca394464a'
+
+
+def test_put_many_merges_partial_updates(store):
+    store.put_many({'a': {'metrics': {'function_count': 1}, 'imports': ['os']}})
+    store.put('a', summary='Reads a file.')
+    store.put_many({'a': {'metrics': {'function_count': 2}}})
+
+    assert store.get('a') == {
+        'metrics': {'function_count': 2},
+        'imports': ['os'],
+        'summary': 'Reads a file.'
+    }
+
+
+def test_size_accounting_after_partial_update(store):
+    store.put_many({'a': {'metrics': {'x': 1}, 'imports': ['os']}})
+    store.put('a', summary='short')
+
+    expected = _payload_size(metrics={'x': 1}, imports=['os'], summary='short')
+    assert _stored_sizes(store) == {'a': expected}
+    assert store.stats()['total_bytes'] == expected
+
+    store.put_many({'a': {'metrics': {'x': 12345}}})
+    expected = _payload_size(metrics={'x': 12345}, imports=['os'], summary='short')
+    assert store.stats()['total_bytes'] == expected
+
+
+def test_running_total_survives_reopen(tmp_path):
+    path = str(tmp_path / 'blobs.sqlite3')
+    BlobStore(path).put('a', summary='hello')
+
+    assert BlobStore(path).stats()['total_bytes'] == len('hello')
+
+
+def test_eviction_removes_least_recently_used_first(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(blob_store_module.time, 'time', lambda: next(clock))
+    store = BlobStore(str(tmp_path / 'blobs.sqlite3'), max_bytes=30)
+
+    for sha in ('a', 'b', 'c'):
+        store.put(sha, summary='x' * 10)
+    # Touch 'a' so 'b' becomes the least recently used entry
+    store.get('a')
+    store.put('d', summary='x' * 10)
+
+    assert set(_stored_sizes(store)) == {'a', 'c', 'd'}
+    assert store.stats()['total_bytes'] == 30
+
+
+def test_bulk_lookup_spans_batches(store):
+    count = blob_store_module._BATCH_SIZE * 2 + 5
+    store.put_many({str(i): {'summary': str(i)} for i in range(count)})
+
+    results = store.get_many([str(i) for i in range(count)] + ['missing'])
+
+    assert len(results) == count
+    assert results[str(count - 1)]['summary'] == str(count - 1)
+    assert store.stats()['hits'] == count
+    assert store.stats()['misses'] == 1
+
+
+def test_required_fields_decide_hits(store):
+    store.put('a', summary='Only a summary.')
+
+    assert store.get_many(['a'], required=('metrics', 'imports')) == {}
+    assert store.get('a', required=('summary',))['summary'] == 'Only a summary.'
+
+    with pytest.raises(ValueError):
+        store.get_many(['a'], required=('bogus',))
+
+
+def test_stats(store):
+    assert store.stats() == {
+        'hits': 0,
+        'misses': 0,
+        'hit_rate': 0.0,
+        'entries': 0,
+        'total_bytes': 0,
+        'max_bytes': store.max_bytes
+    }
+
+    store.put('a', summary='abc')
+    store.get_many(['a', 'b', 'c', 'a'])
+
+    stats = store.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['hit_rate'] == pytest.approx(1 / 3)
+    assert stats['entries'] == 1
+    assert stats['total_bytes'] == 3
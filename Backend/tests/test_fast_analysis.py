@@ -0,0 +1,149 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from github import GithubException
+
+from app import create_app
+from app.services.analysis_service import AnalysisService
+
+THRESHOLD_KB = 1000
+
+
+def _tree(paths, truncated=False):
+    return SimpleNamespace(
+        tree=[SimpleNamespace(path=path, type='blob', size=10, sha=f'sha-{path}') for path in paths],
+        raw_data={'truncated': truncated}
+    )
+
+
+def _repo(size=10, paths=('app.py', 'src/util.py', 'README.md'), truncated=False):
+    repo = MagicMock()
+    repo.name = 'demo'
+    repo.description = 'A demo project.'
+    repo.owner.login = 'octo'
+    repo.stargazers_count = 1
+    repo.forks_count = 0
+    repo.language = 'Python'
+    repo.get_topics.return_value = []
+    repo.created_at = repo.updated_at = datetime(2024, 1, 1)
+    repo.size = size
+    repo.default_branch = 'main'
+    repo.get_git_tree.return_value = _tree(paths, truncated)
+    repo.get_readme.side_effect = GithubException(404, {}, None)
+    return repo
+
+
+@pytest.fixture
+def github(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr('app.services.github_service.Github', lambda token: client)
+    return client
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    analyzer = MagicMock()
+    analyzer.analyze_repository.return_value = {'repository_name': 'demo'}
+    monkeypatch.setattr('app.routes.RepositoryAnalyzer', lambda **kwargs: analyzer)
+    return analyzer
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv('BLOB_STORE_PATH', str(tmp_path / 'blobs.sqlite3'))
+    monkeypatch.setenv('FAST_ANALYSIS_SIZE_THRESHOLD_KB', str(THRESHOLD_KB))
+    return create_app().test_client()
+
+
+def _analyze(client, **body):
+    return client.post('/api/analyze', json={'repo_url': 'https://github.com/octo/demo', **body})
+
+
+@pytest.mark.parametrize('size, expected', [(THRESHOLD_KB, 'deep'), (THRESHOLD_KB + 1, 'fast')])
+def test_auto_mode_picks_from_repo_size(client, github, analyzer, size, expected):
+    github.get_repo.return_value = _repo(size=size)
+
+    response = _analyze(client)
+
+    assert response.status_code == 200
+    assert response.get_json()['mode'] == expected
+    assert analyzer.analyze_repository.called == (expected == 'deep')
+    github.get_repo.assert_called_once_with('octo/demo')
+
+
+def test_auto_mode_falls_back_to_deep_when_metadata_lookup_fails(client, github, analyzer):
+    github.get_repo.side_effect = GithubException(403, {'message': 'rate limit'}, None)
+
+    response = _analyze(client)
+
+    assert response.status_code == 200
+    assert response.get_json()['mode'] == 'deep'
+
+
+def test_auto_mode_falls_back_to_deep_for_non_github_url(client, github, analyzer):
+    response = client.post('/api/analyze', json={'repo_url': 'https://gitlab.com/octo/demo.git'})
+
+    assert response.status_code == 200
+    assert response.get_json()['mode'] == 'deep'
+    github.get_repo.assert_not_called()
+
+
+@pytest.mark.parametrize('body', [{'mode': 'quick'}, {'include_summary': 'false'}, {'include_summary': 1}])
+def test_invalid_options_are_rejected(client, github, analyzer, body):
+    response = _analyze(client, **body)
+
+    assert response.status_code == 400
+    github.get_repo.assert_not_called()
+    analyzer.analyze_repository.assert_not_called()
+
+
+def test_fast_mode_surfaces_truncated_listing(client, github):
+    github.get_repo.return_value = _repo(truncated=True)
+
+    result = _analyze(client, mode='fast').get_json()
+
+    assert result['mode'] == 'fast'
+    assert result['truncated'] is True
+    assert 'GitHub truncated the file listing' in result['readme_content']
+
+
+def test_fast_mode_without_truncation_has_no_note(client, github):
+    github.get_repo.return_value = _repo()
+
+    result = _analyze(client, mode='fast').get_json()
+
+    assert result['truncated'] is False
+    assert 'truncated' not in result['readme_content']
+    assert result['documentation']['technical_documentation']['code_analysis']['total_files'] == 3
+
+
+def test_fast_mode_handles_empty_repository(client, github):
+    repo = _repo()
+    repo.get_git_tree.side_effect = GithubException(409, {'message': 'Git Repository is empty.'}, None)
+    github.get_repo.return_value = repo
+
+    response = _analyze(client, mode='fast')
+
+    assert response.status_code == 200
+    assert response.get_json()['structure']['languages'] == {}
+
+
+def test_summarize_structure_shape():
+    repo_data = {'files': [
+        {'path': 'app.py'},
+        {'path': 'src/util.py'},
+        {'path': 'web/index.js'},
+        {'path': 'README.md'}
+    ]}
+
+    structure = AnalysisService().summarize_structure(repo_data)
+
+    assert structure == {
+        'languages': {'.py': 2, '.js': 1},
+        'main_files': [],
+        'entry_points': ['app.py', 'web/index.js'],
+        'complexity_metrics': {},
+        'dependencies': {'python': [], 'javascript': [], 'java': [], 'ruby': []}
+    }
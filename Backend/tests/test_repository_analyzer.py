@@ -0,0 +1,93 @@
+import os
+
+import pytest
+from git import Repo
+
+from app.repository_analyzer import RepositoryAnalyzer
+from app.services.blob_store import BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / 'blobs.sqlite3'))
+
+
+@pytest.fixture
+def analyzer(store):
+    # Skip __init__ so no GitHub client or models are created
+    analyzer = RepositoryAnalyzer.__new__(RepositoryAnalyzer)
+    analyzer.blob_store = store
+    return analyzer
+
+
+def _make_repo(path, files, symlinks=()):
+    for name, content in files.items():
+        file_path = os.path.join(path, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        mode = 'wb' if isinstance(content, bytes) else 'w'
+        with open(file_path, mode) as f:
+            f.write(content)
+    for name, target in symlinks:
+        os.symlink(target, os.path.join(path, name))
+
+    repo = Repo.init(path)
+    repo.git.add(A=True)
+    return str(path)
+
+
+def test_get_blob_shas_skips_symlinks(analyzer, tmp_path):
+    repo_path = _make_repo(
+        tmp_path / 'repo',
+        {'real.py': 'import os\n'},
+        symlinks=[('link.py', 'real.py')]
+    )
+
+    assert set(analyzer.get_blob_shas(repo_path)) == {os.path.join(repo_path, 'real.py')}
+
+
+def test_symlinks_with_same_target_text_keep_their_own_results(analyzer, tmp_path):
+    repo_path = _make_repo(
+        tmp_path / 'repo',
+        {'a/real.py': 'import os\n', 'b/real.py': 'import json\n'},
+        symlinks=[('a/link.py', 'real.py'), ('b/link.py', 'real.py')]
+    )
+
+    # Run twice so the second pass reads from the store
+    for _ in range(2):
+        structure = analyzer.analyze_code_structure(repo_path)
+        assert structure['imports'][os.path.join(repo_path, 'a', 'link.py')] == ['os']
+        assert structure['imports'][os.path.join(repo_path, 'b', 'link.py')] == ['json']
+
+
+def test_identical_files_and_non_code_files(analyzer, store, tmp_path, monkeypatch):
+    code = 'import os\n\ndef f():\n    return 1\n'
+    repo_path = _make_repo(
+        tmp_path / 'repo',
+        {'a.py': code, 'b.py': code, 'README.md': '# Hi\n', 'data.txt': '1,2\n'}
+    )
+    parsed = []
+    original = RepositoryAnalyzer.analyze_file
+    monkeypatch.setattr(
+        RepositoryAnalyzer, 'analyze_file',
+        lambda self, source: parsed.append(source) or original(self, source)
+    )
+
+    cold = analyzer.analyze_code_structure(repo_path)
+    assert len(parsed) == 1
+    assert cold['imports'][os.path.join(repo_path, 'b.py')] == ['os']
+
+    analyzer.analyze_code_structure(repo_path)
+    assert len(parsed) == 1
+    assert (store.stats()['hits'], store.stats()['misses']) == (1, 1)
+
+
+def test_undecodable_file_resolves_from_store(analyzer, store, tmp_path):
+    repo_path = _make_repo(tmp_path / 'repo', {'bad.js': b'\xff\xfe\x00var x;'})
+    bad_path = os.path.join(repo_path, 'bad.js')
+
+    cold = analyzer.analyze_code_structure(repo_path)
+    warm = analyzer.analyze_code_structure(repo_path)
+
+    assert cold['complexity_metrics'][bad_path] == warm['complexity_metrics'][bad_path] == {}
+    assert warm['imports'][bad_path] == []
+    assert (store.stats()['hits'], store.stats()['misses']) == (1, 1)